@@ -0,0 +1,232 @@
+"""
+Shared views.py parse cache for the AI views refactoring scripts
+
+refactor_ai_views.py and refactor_ai_views_advanced.py both start by
+loading apps/backend/src/apps/ai/views.py. load_parsed_views() reads it
+once, scans its top-level statements, and pickles the result under
+.refactor_cache/ keyed by the file bytes and interpreter version, so
+whichever script runs second reuses the first one's work.
+"""
+
+import re
+import sys
+import ast
+import pickle
+import hashlib
+from pathlib import Path
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+PROJECT_ROOT = Path(__file__).parent
+CACHE_DIR = PROJECT_ROOT / ".refactor_cache"
+
+# Part of every cache key; bump whenever scan_top_level() output changes
+_CACHE_FORMAT = 3
+
+
+# Column-0 statement patterns used by scan_top_level()
+_TOP_LEVEL_RE = re.compile(
+    r'(?P<kind>class|def|async\s+def)\s+(?P<name>\w+)'
+    r'|(?P<import>import|from)\s'
+)
+_CONST_RE = re.compile(r'[A-Z_][A-Z0-9_]*\s*=(?!=)')
+_CLAUSE_RE = re.compile(r'[)\]}]|(?:else|elif|except|finally)\b')
+
+# Tokens that affect bracket depth or string state; a lone quote is an
+# unterminated single-line string
+_TOKEN_RE = re.compile(
+    r'"""|\'\'\'|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'|["\'#()\[\]{}]'
+)
+_OPENERS = '([{'
+_CLOSERS = ')]}'
+
+
+# =============================================================================
+# Top-level Scanner
+# =============================================================================
+
+def _scan_line(line, delimiter, depth):
+    """
+    Advance the string and bracket state of scan_top_level() over one line.
+
+    Args:
+        line: Source line
+        delimiter: Open triple-quote delimiter carried in from the previous
+            line, or None
+        depth: Bracket depth carried in from the previous line
+
+    Returns:
+        Tuple of (delimiter, depth, continued); depth is None when the line
+        cannot be followed reliably (unterminated string, unbalanced closer),
+        and continued is True only for a trailing backslash outside any
+        string or comment
+    """
+    pos = 0
+    while True:
+        if delimiter is not None:
+            end = line.find(delimiter, pos)
+            if end == -1:
+                return delimiter, depth, False
+            pos = end + 3
+            delimiter = None
+
+        match = _TOKEN_RE.search(line, pos)
+        if match is None:
+            return None, depth, line.rstrip('\r\n').endswith('\\')
+
+        token = match.group()
+        pos = match.end()
+        if token == '#':
+            return None, depth, False
+        if token in ('"""', "'''"):
+            delimiter = token
+        elif token in ('"', "'"):
+            return None, None, False
+        elif token in _OPENERS:
+            depth += 1
+        elif token in _CLOSERS:
+            depth -= 1
+            if depth < 0:
+                return None, None, False
+
+
+def scan_top_level(source_lines):
+    """
+    Build a shallow module tree from the column-0 statements only.
+
+    ast.parse builds every node inside every function body, but the
+    refactor only needs top-level names and line spans. The scanner walks
+    the lines, skipping triple-quoted strings, bracketed expressions and
+    continuation lines, and returns ClassDef/FunctionDef/Import nodes plus Assign nodes for
+    UPPER_CASE constants, all with positions but no bodies.
+
+    Args:
+        source_lines: List of source code lines
+
+    Returns:
+        ast.Module, or None when the layout is ambiguous and the caller
+        should fall back to ast.parse
+    """
+    statements = []  # [first_line, last_code_line], 0-indexed
+    delimiter = None
+    depth = 0
+    continued = False
+
+    for index, line in enumerate(source_lines):
+        stripped = line.strip()
+        in_string = delimiter is not None
+
+        if (not in_string and not continued and depth == 0
+                and line[:1] not in ' \t\r\n#' and not _CLAUSE_RE.match(line)):
+            statements.append([index, index])
+        elif stripped and (in_string or not stripped.startswith('#')):
+            if not statements:
+                return None
+            statements[-1][1] = index
+
+        delimiter, depth, continued = _scan_line(line, delimiter, depth)
+        if depth is None:
+            return None
+
+    if delimiter is not None or depth:
+        return None
+
+    body = []
+    decorators = []
+    for start, end in statements:
+        header = source_lines[start]
+        position = {'lineno': start + 1, 'end_lineno': end + 1, 'col_offset': 0}
+
+        if header.startswith('@'):
+            decorators.append(ast.Name(id='', ctx=ast.Load(), **position))
+            continue
+
+        match = _TOP_LEVEL_RE.match(header)
+        if match and match.group('kind'):
+            node_type = {'class': ast.ClassDef, 'def': ast.FunctionDef}.get(
+                match.group('kind'), ast.AsyncFunctionDef
+            )
+            body.append(node_type(name=match.group('name'), body=[], decorator_list=decorators, **position))
+            decorators = []
+            continue
+
+        if decorators:
+            return None
+
+        if match and match.group('import'):
+            body.append(ast.Import(names=[], **position))
+        elif _CONST_RE.match(header):
+            target = ast.Name(id=header[:header.index('=')].rstrip(), ctx=ast.Store())
+            body.append(ast.Assign(targets=[target], value=None, **position))
+
+    if decorators:
+        return None
+
+    return ast.Module(body=body, type_ignores=[])
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+def _cache_path(data):
+    """
+    Return the cache file for a given views.py content.
+
+    The interpreter version is part of the key because pickled ast nodes
+    are only valid for the Python release that produced them, and
+    _CACHE_FORMAT because trees from an older scanner may differ.
+    """
+    digest = hashlib.sha256(data)
+    digest.update(repr((tuple(sys.version_info), _CACHE_FORMAT)).encode('ascii'))
+    return CACHE_DIR / f"{digest.hexdigest()}.pkl"
+
+
+def load_cached_tree(data):
+    """Return the tree cached for these exact bytes, or None on a miss."""
+    try:
+        return pickle.loads(_cache_path(data).read_bytes())
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+
+def store_cached_tree(data, tree):
+    """Cache a parsed tree under the hash of its source. Failures are ignored."""
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        _cache_path(data).write_bytes(pickle.dumps(tree, protocol=5))
+    except OSError:
+        pass
+
+
+def load_parsed_views(path):
+    """
+    Load a views file and its shallow top-level tree.
+
+    Args:
+        path: Path to the views.py file
+
+    Returns:
+        Tuple of (source_lines, tree, from_cache)
+
+    Raises:
+        SyntaxError: if the scanner falls back to ast.parse and the file
+            does not parse
+    """
+    data = path.read_bytes()
+    # Same newline translation read_text() would have applied
+    source = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+    source_lines = source.splitlines(keepends=True)
+
+    tree = load_cached_tree(data)
+    if tree is not None:
+        return source_lines, tree, True
+
+    tree = scan_top_level(source_lines)
+    if tree is None:
+        tree = ast.parse(source)
+    store_cached_tree(data, tree)
+    return source_lines, tree, False
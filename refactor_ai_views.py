@@ -21,12 +21,17 @@ Safety:
 - Provides rollback instructions if needed
 """
 
+import io
 import os
 import sys
+import stat
 import shutil
+import contextlib
 from pathlib import Path
 from datetime import datetime
 
+from _parse_cache import load_parsed_views
+
 
 # =============================================================================
 # Configuration
@@ -194,10 +199,42 @@ from .helpers import (
 }
 
 
+# Derived once from MODULES for create_init_file()
+_MODULE_BASES = {name: name.removesuffix('.py') for name in MODULES}
+_ALL_EXPORTS = sorted({export for config in MODULES.values() for export in config['exports']})
+_IMPORT_BLOCKS = {
+    name: f"from .{_MODULE_BASES[name]} import (\n"
+          + ''.join(f"    {export},\n" for export in config['exports'])
+          + ")\n\n"
+    for name, config in MODULES.items()
+}
+
+
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
+class _Buffered(contextlib.ContextDecorator):
+    """
+    Collect everything a step prints and write it to stdout in one call.
+
+    stdout is line-buffered on a TTY, so each print() would otherwise be
+    its own write. Usable as a decorator on step functions or as a
+    ``with`` block; output is flushed even if the step raises.
+    """
+
+    def __enter__(self):
+        self._stdout = sys.stdout
+        self._buffer = sys.stdout = io.StringIO()
+        return self
+
+    def __exit__(self, *exc_info):
+        sys.stdout = self._stdout
+        self._stdout.write(self._buffer.getvalue())
+        self._stdout.flush()
+        return False
+
+
 def print_header(text):
     """Print formatted header."""
     print(f"\n{'='*70}")
@@ -220,11 +257,18 @@ def print_error(text):
     print(f"  ✗ ERROR: {text}")
 
 
+@_Buffered()
 def validate_environment():
     """Validate that we're in the correct directory and files exist."""
     print_step(1, "Validating environment...")
 
-    if not AI_APP_PATH.exists():
+    # One stat() per path: it answers both "exists?" and "what is it?"
+    try:
+        app_is_dir = stat.S_ISDIR(AI_APP_PATH.stat().st_mode)
+    except FileNotFoundError:
+        app_is_dir = False
+
+    if not app_is_dir:
         print_error(f"AI app directory not found: {AI_APP_PATH}")
         print(f"\nExpected path: {AI_APP_PATH}")
         print(f"Current working directory: {os.getcwd()}")
@@ -233,14 +277,15 @@ def validate_environment():
 
     print_success(f"AI app directory found: {AI_APP_PATH}")
 
-    if not VIEWS_FILE.exists():
+    try:
+        file_size = VIEWS_FILE.stat().st_size
+    except FileNotFoundError:
         print_error(f"views.py not found: {VIEWS_FILE}")
         return False
 
     print_success(f"views.py found: {VIEWS_FILE}")
 
     # Check file size
-    file_size = VIEWS_FILE.stat().st_size
     print_success(f"views.py size: {file_size:,} bytes")
 
     if file_size < 10000:
@@ -250,6 +295,7 @@ def validate_environment():
     return True
 
 
+@_Buffered()
 def create_backup():
     """Create backup of original views.py."""
     print_step(2, "Creating backup...")
@@ -265,6 +311,7 @@ def create_backup():
     return True
 
 
+@_Buffered()
 def read_views_file():
     """Read the original views.py file."""
     print_step(3, "Reading original views.py...")
@@ -272,13 +319,21 @@ def read_views_file():
     try:
         with open(VIEWS_FILE, 'r', encoding='utf-8') as f:
             lines = f.readlines()
-
-        print_success(f"Read {len(lines)} lines from views.py")
-        return lines
     except Exception as e:
         print_error(f"Failed to read views.py: {e}")
         return None
 
+    # Warm the parse cache shared with refactor_ai_views_advanced.py. This
+    # script extracts fixed line ranges, so a file that does not parse is
+    # not an error here.
+    try:
+        load_parsed_views(VIEWS_FILE)
+    except (SyntaxError, ValueError, OSError):
+        pass
+
+    print_success(f"Read {len(lines)} lines from views.py")
+    return lines
+
 
 def extract_lines(lines, line_range):
     """Extract lines from a range (1-indexed to 0-indexed)."""
@@ -293,6 +348,7 @@ def extract_lines(lines, line_range):
         return lines[start-1:end]
 
 
+@_Buffered()
 def create_views_directory():
     """Create the views/ directory."""
     print_step(4, "Creating views/ directory...")
@@ -317,7 +373,8 @@ def create_module_file(module_name, config, lines):
         content_lines = []
 
     # Build file content
-    file_content = f'''"""
+    buf = io.StringIO()
+    buf.write(f'''"""
 {config['description'].capitalize()}.
 
 This module is part of the refactored AI views structure.
@@ -325,7 +382,7 @@ Generated automatically by refactor_ai_views.py
 """
 
 {config['imports']}
-'''
+''')
 
     # Add the extracted code
     if content_lines:
@@ -336,23 +393,24 @@ Generated automatically by refactor_ai_views.py
                 code_start = i
                 break
 
-        file_content += '\n'.join(content_lines[code_start:])
+        # Lines keep their own newlines from readlines()
+        buf.writelines(content_lines[code_start:])
 
     # Write file
     try:
-        with open(module_path, 'w', encoding='utf-8') as f:
-            f.write(file_content)
+        module_path.write_text(buf.getvalue(), encoding='utf-8')
         return True
     except Exception as e:
         print_error(f"Failed to create {module_name}: {e}")
         return False
 
 
+@_Buffered()
 def create_init_file():
     """Create __init__.py with all exports."""
     print_step(5, "Creating __init__.py...")
 
-    init_content = '''"""
+    init_header = '''"""
 AI app views package.
 
 This package organizes AI-related views into focused modules:
@@ -367,25 +425,8 @@ Generated automatically by refactor_ai_views.py
 
 '''
 
-    # Add imports from each module
-    for module_name, config in MODULES.items():
-        module_base = module_name.replace('.py', '')
-        exports = config['exports']
-
-        init_content += f"from .{module_base} import (\n"
-        for export in exports:
-            init_content += f"    {export},\n"
-        init_content += ")\n\n"
-
-    # Add __all__
-    all_exports = []
-    for config in MODULES.values():
-        all_exports.extend(config['exports'])
-
-    init_content += "__all__ = [\n"
-    for export in sorted(all_exports):
-        init_content += f"    '{export}',\n"
-    init_content += "]\n"
+    all_block = "__all__ = [\n" + ''.join(f"    '{export}',\n" for export in _ALL_EXPORTS) + "]\n"
+    init_content = ''.join([init_header, *_IMPORT_BLOCKS.values(), all_block])
 
     # Write file
     init_path = VIEWS_DIR / "__init__.py"
@@ -399,13 +440,14 @@ Generated automatically by refactor_ai_views.py
         return False
 
 
+@_Buffered()
 def generate_report():
     """Generate a refactoring report."""
     print_step(6, "Generating report...")
 
     report_path = PROJECT_ROOT / "REFACTORING_REPORT.md"
 
-    report_content = f"""# AI Views Refactoring Report
+    parts = [f"""# AI Views Refactoring Report
 
 **Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 **Status:** Completed Successfully
@@ -430,17 +472,16 @@ apps/backend/src/apps/ai/
 
 ## Module Breakdown
 
-"""
+"""]
 
-    for module_name, config in MODULES.items():
-        report_content += f"""### {module_name}
+    parts.extend(f"""### {module_name}
 **Description:** {config['description']}
 **Classes:** {len(config['classes'])}
 **Exports:** {', '.join(config['exports'])}
 
-"""
+""" for module_name, config in MODULES.items())
 
-    report_content += """## Verification Checklist
+    parts.append("""## Verification Checklist
 
 Before deploying, verify:
 
@@ -477,11 +518,10 @@ If issues occur:
 - Created: 5 new module files + __init__.py
 - Backed up: `views.py` → `views_backup.py`
 - Original `views.py` remains unchanged (will be removed after verification)
-"""
+""")
 
     try:
-        with open(report_path, 'w', encoding='utf-8') as f:
-            f.write(report_content)
+        report_path.write_text(''.join(parts), encoding='utf-8')
         print_success(f"Report generated: {report_path.name}")
         return True
     except Exception as e:
@@ -519,19 +559,20 @@ def main():
         return 1
 
     # Create module files
-    print_step(5, "Creating module files...")
-    for module_name, config in MODULES.items():
-        if module_name == 'helpers.py':
-            # helpers.py already created manually with better content
-            if (VIEWS_DIR / module_name).exists():
-                print_success(f"  {module_name} (already exists)")
-                continue
-
-        if create_module_file(module_name, config, lines):
-            print_success(f"  {module_name}")
-        else:
-            print_error(f"  {module_name}")
-            return 1
+    with _Buffered():
+        print_step(5, "Creating module files...")
+        for module_name, config in MODULES.items():
+            if module_name == 'helpers.py':
+                # helpers.py already created manually with better content
+                if (VIEWS_DIR / module_name).exists():
+                    print_success(f"  {module_name} (already exists)")
+                    continue
+
+            if create_module_file(module_name, config, lines):
+                print_success(f"  {module_name}")
+            else:
+                print_error(f"  {module_name}")
+                return 1
 
     # Create __init__.py
     if not create_init_file():
@@ -543,26 +584,27 @@ def main():
         print("\n⚠️  Warning: Failed to generate report, but refactoring completed.")
 
     # Success!
-    print_header("✅ Refactoring Complete!")
-
-    print("Summary:")
-    print(f"  • Created views/ directory: {VIEWS_DIR}")
-    print(f"  • Created {len(MODULES)} module files")
-    print(f"  • Created __init__.py with exports")
-    print(f"  • Backup saved: {BACKUP_FILE.name}")
-    print(f"  • Report saved: REFACTORING_REPORT.md")
-
-    print("\n⚠️  IMPORTANT: The original views.py still exists!")
-    print("     After testing, you can safely remove it.")
-
-    print("\nNext steps:")
-    print("  1. Test imports: python -c 'from apps.ai.views import PhotoAnalysisViewSet'")
-    print("  2. Run checks: cd apps/backend && python src/manage.py check")
-    print("  3. Test endpoints with Postman or curl")
-    print("  4. If all works, remove old views.py")
-
-    print("\nRollback if needed:")
-    print(f"  cp {BACKUP_FILE.name} views.py && rm -rf views/")
+    with _Buffered():
+        print_header("✅ Refactoring Complete!")
+
+        print("Summary:")
+        print(f"  • Created views/ directory: {VIEWS_DIR}")
+        print(f"  • Created {len(MODULES)} module files")
+        print(f"  • Created __init__.py with exports")
+        print(f"  • Backup saved: {BACKUP_FILE.name}")
+        print(f"  • Report saved: REFACTORING_REPORT.md")
+
+        print("\n⚠️  IMPORTANT: The original views.py still exists!")
+        print("     After testing, you can safely remove it.")
+
+        print("\nNext steps:")
+        print("  1. Test imports: python -c 'from apps.ai.views import PhotoAnalysisViewSet'")
+        print("  2. Run checks: cd apps/backend && python src/manage.py check")
+        print("  3. Test endpoints with Postman or curl")
+        print("  4. If all works, remove old views.py")
+
+        print("\nRollback if needed:")
+        print(f"  cp {BACKUP_FILE.name} views.py && rm -rf views/")
 
     return 0
 
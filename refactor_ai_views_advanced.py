@@ -20,9 +20,13 @@ import os
 import sys
 import ast
 import shutil
+import threading
 from pathlib import Path
+from itertools import chain
 from datetime import datetime
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from _parse_cache import load_parsed_views
 
 
 # =============================================================================
@@ -35,35 +39,8 @@ VIEWS_FILE = AI_APP_PATH / "views.py"
 VIEWS_DIR = AI_APP_PATH / "views"
 BACKUP_FILE = AI_APP_PATH / "views_backup.py"
 
-
-# Class to module mapping
-CLASS_TO_MODULE = {
-    # Photo Analysis Module
-    'PhotoAnalysisViewSet': 'photo_analysis',
-    'GeneratedMessageViewSet': 'photo_analysis',
-    'PhotoAnalysisView': 'photo_analysis',
-    'ColorExtractionView': 'photo_analysis',
-
-    # Message Generation Module
-    'MoodDetectionView': 'message_generation',
-    'GenerateMessagesView': 'message_generation',
-    'GenerateHashtagsView': 'message_generation',
-    'AnalyzePhotoView': 'message_generation',
-    'ExtractColorsView': 'message_generation',
-    'DetectMoodView': 'message_generation',
-    'MessageStylesView': 'message_generation',
-
-    # Recommendations Module
-    'StyleRecommendationsView': 'recommendations',
-    'TemplateRecommendationsView': 'recommendations',
-    'RecommendTemplatesView': 'recommendations',
-    'RecommendStylesView': 'recommendations',
-
-    # Usage Module
-    'AIUsageStatsView': 'usage',
-    'AIUsageLimitsView': 'usage',
-    'SmartSuggestionsView': 'usage',
-}
+# Upper bound on concurrent module writers
+MAX_WRITE_WORKERS = 8
 
 
 MODULE_INFO = {
@@ -91,31 +68,47 @@ MODULE_INFO = {
     },
 }
 
+# Class to module mapping, derived from MODULE_INFO so the two cannot drift
+CLASS_TO_MODULE = {
+    class_name: module_name
+    for module_name, info in MODULE_INFO.items()
+    for class_name in info.get('classes', [])
+}
+
 
 # =============================================================================
 # Utility Functions
 # =============================================================================
 
+# Module files are written from worker threads; keep their lines whole
+_print_lock = threading.Lock()
+
+
 def print_header(text):
-    print(f"\n{'='*70}")
-    print(f"  {text}")
-    print(f"{'='*70}\n")
+    with _print_lock:
+        print(f"\n{'='*70}")
+        print(f"  {text}")
+        print(f"{'='*70}\n")
 
 
 def print_step(step_num, text):
-    print(f"\n[Step {step_num}] {text}")
+    with _print_lock:
+        print(f"\n[Step {step_num}] {text}")
 
 
 def print_success(text):
-    print(f"  ✓ {text}")
+    with _print_lock:
+        print(f"  ✓ {text}")
 
 
 def print_error(text):
-    print(f"  ✗ ERROR: {text}")
+    with _print_lock:
+        print(f"  ✗ ERROR: {text}")
 
 
 def print_warning(text):
-    print(f"  ⚠  WARNING: {text}")
+    with _print_lock:
+        print(f"  ⚠  WARNING: {text}")
 
 
 # =============================================================================
@@ -136,9 +129,9 @@ def extract_class_code(source_lines, class_node):
     start_line = class_node.lineno - 1
     end_line = class_node.end_lineno
 
-    # Include decorator lines if present
+    # Include decorator lines if present (decorators are kept in source order)
     if class_node.decorator_list:
-        first_decorator = min(d.lineno for d in class_node.decorator_list)
+        first_decorator = class_node.decorator_list[0].lineno
         start_line = first_decorator - 1
 
     return ''.join(source_lines[start_line:end_line])
@@ -150,7 +143,7 @@ def extract_function_code(source_lines, func_node):
     end_line = func_node.end_lineno
 
     if func_node.decorator_list:
-        first_decorator = min(d.lineno for d in func_node.decorator_list)
+        first_decorator = func_node.decorator_list[0].lineno
         start_line = first_decorator - 1
 
     return ''.join(source_lines[start_line:end_line])
@@ -158,24 +151,19 @@ def extract_function_code(source_lines, func_node):
 
 def extract_imports_and_constants(source_lines, tree):
     """
-    Extract imports, constants, and module docstring from the original file.
+    Extract imports and constants from the original file.
+
+    The module docstring is not carried over; generated modules write
+    their own. Use ast.get_docstring if it is ever needed.
 
     Returns:
-        dict with 'docstring', 'imports', and 'constants' keys
+        dict with 'imports' and 'constants' keys
     """
     result = {
-        'docstring': '',
         'imports': [],
         'constants': []
     }
 
-    # Extract module docstring
-    if (tree.body and
-        isinstance(tree.body[0], ast.Expr) and
-        isinstance(tree.body[0].value, ast.Constant) and
-        isinstance(tree.body[0].value.value, str)):
-        result['docstring'] = tree.body[0].value.value
-
     # Extract imports and constants
     for node in tree.body:
         if isinstance(node, (ast.Import, ast.ImportFrom)):
@@ -198,19 +186,18 @@ def parse_views_file():
     print_step(1, "Parsing views.py with AST...")
 
     try:
-        with open(VIEWS_FILE, 'r', encoding='utf-8') as f:
-            source = f.read()
-            source_lines = source.splitlines(keepends=True)
-
-        tree = ast.parse(source)
+        source_lines, tree, from_cache = load_parsed_views(VIEWS_FILE)
+        if from_cache:
+            print_success("Reusing cached parse of unchanged views.py")
         print_success(f"Successfully parsed {len(source_lines)} lines")
 
         # Extract imports and constants
         header_info = extract_imports_and_constants(source_lines, tree)
 
-        # Group classes by module
-        module_classes = defaultdict(list)
-        module_functions = defaultdict(list)
+        # Group classes by module. tree.body is in source order, so every
+        # list below is already sorted by 'lineno' for the module writers.
+        module_classes = {module_name: [] for module_name in MODULE_INFO}
+        module_functions = {'helpers': []}
 
         for node in tree.body:
             if isinstance(node, ast.ClassDef):
@@ -242,8 +229,8 @@ def parse_views_file():
 
         return {
             'header': header_info,
-            'module_classes': dict(module_classes),
-            'module_functions': dict(module_functions),
+            'module_classes': module_classes,
+            'module_functions': module_functions,
             'source_lines': source_lines
         }
 
@@ -259,9 +246,8 @@ def parse_views_file():
 # Module Generation Functions
 # =============================================================================
 
-def generate_module_imports(module_name, parsed_data):
-    """Generate appropriate imports for a module."""
-    base_imports = '''import time
+# Import blocks for generated modules
+_BASE_IMPORTS = '''import time
 import uuid
 import logging
 from typing import Dict, Any, Optional, List
@@ -306,8 +292,7 @@ from .helpers import (
 )
 '''
 
-    if module_name == 'helpers':
-        return '''import logging
+_HELPERS_IMPORTS = '''import logging
 from typing import Dict, Any, Optional
 
 from rest_framework import status
@@ -323,60 +308,82 @@ logger = logging.getLogger(__name__)
 
 '''
 
-    return base_imports
 
+def generate_module_imports(module_name):
+    """Return the import block for a generated module."""
+    if module_name == 'helpers':
+        return _HELPERS_IMPORTS
 
-def create_module_file(module_name, parsed_data):
-    """Create a module file with extracted classes."""
-    print_success(f"  Creating {module_name}.py...")
+    return _BASE_IMPORTS
 
-    module_path = VIEWS_DIR / f"{module_name}.py"
-    info = MODULE_INFO.get(module_name, {})
 
-    # Build file content
-    content = f'''"""
+def _make_writer(module_name, info):
+    """
+    Build the file writer for one MODULE_INFO entry.
+
+    The path, docstring and import block only depend on the module, so they
+    are resolved once here. The helpers module also gets the constants and
+    helper functions; that choice is made here too, so the returned
+    writer(parsed_data) just appends the extracted code and writes the file.
+    """
+    module_path = VIEWS_DIR / f"{module_name}.py"
+    header = f'''"""
 {info.get('description', 'AI views module')}.
 
 This module is part of the refactored AI views structure.
 Generated automatically by refactor_ai_views_advanced.py
 """
 
-'''
+''' + generate_module_imports(module_name)
 
-    # Add imports
-    content += generate_module_imports(module_name, parsed_data)
+    def write_classes(parsed_data, parts):
+        """Append the module's classes to parts and write the file."""
+        classes = parsed_data['module_classes'].get(module_name, [])
+        for cls in classes:
+            parts.extend(('\n', cls['code'], '\n\n'))
 
-    # Add constants for helpers module
-    if module_name == 'helpers':
+        content = ''.join(parts)
+
+        # Write file
+        try:
+            module_path.write_text(content, encoding='utf-8')
+            return True
+        except Exception as e:
+            print_error(f"Failed to write {module_name}.py: {e}")
+            return False
+
+    def writer(parsed_data):
+        """Create the module file with its extracted classes."""
+        return write_classes(parsed_data, [header])
+
+    def helpers_writer(parsed_data):
+        """Create helpers.py with the constants, helper functions and classes."""
+        parts = [header]
+
+        # Add constants
         constants_section = '\n'.join(parsed_data['header']['constants'])
         if constants_section:
-            content += '\n' + constants_section + '\n\n'
+            parts.extend(('\n', constants_section, '\n\n'))
 
         # Add helper functions
         functions = parsed_data['module_functions'].get('helpers', [])
-        for func in sorted(functions, key=lambda x: x['lineno']):
-            content += '\n' + func['code'] + '\n\n'
+        for func in functions:
+            parts.extend(('\n', func['code'], '\n\n'))
 
-    # Add classes
-    classes = parsed_data['module_classes'].get(module_name, [])
-    for cls in sorted(classes, key=lambda x: x['lineno']):
-        content += '\n' + cls['code'] + '\n\n'
+        return write_classes(parsed_data, parts)
+
+    return helpers_writer if module_name == 'helpers' else writer
 
-    # Write file
-    try:
-        with open(module_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        return True
-    except Exception as e:
-        print_error(f"Failed to write {module_name}.py: {e}")
-        return False
+
+# One writer per generated module, keyed by module name
+_WRITERS = {module_name: _make_writer(module_name, info) for module_name, info in MODULE_INFO.items()}
 
 
 def create_init_file():
     """Create __init__.py with all exports."""
     print_success("  Creating __init__.py...")
 
-    content = '''"""
+    parts = ['''"""
 AI app views package.
 
 This package organizes AI-related views into focused modules:
@@ -389,7 +396,7 @@ This package organizes AI-related views into focused modules:
 Generated automatically by refactor_ai_views_advanced.py
 """
 
-'''
+''']
 
     # Add imports
     for module_name, info in MODULE_INFO.items():
@@ -397,27 +404,27 @@ Generated automatically by refactor_ai_views_advanced.py
         if not exports:
             continue
 
-        content += f"from .{module_name} import (\n"
-        for item in exports:
-            content += f"    {item},\n"
-        content += ")\n\n"
+        parts.append(f"from .{module_name} import (\n")
+        parts.append('\n'.join(f"    {item}," for item in exports))
+        parts.append("\n)\n\n")
 
     # Add __all__
-    all_exports = []
-    for info in MODULE_INFO.values():
-        all_exports.extend(info.get('classes', []))
-        all_exports.extend(info.get('functions', []))
+    all_exports = sorted({
+        item
+        for info in MODULE_INFO.values()
+        for item in chain(info.get('classes', ()), info.get('functions', ()))
+    })
 
-    content += "__all__ = [\n"
-    for item in sorted(set(all_exports)):
-        content += f"    '{item}',\n"
-    content += "]\n"
+    parts.append("__all__ = [\n")
+    parts.append('\n'.join(f"    '{item}'," for item in all_exports))
+    parts.append("\n]\n")
+
+    content = ''.join(parts)
 
     # Write file
     init_path = VIEWS_DIR / "__init__.py"
     try:
-        with open(init_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        init_path.write_text(content, encoding='utf-8')
         return True
     except Exception as e:
         print_error(f"Failed to create __init__.py: {e}")
@@ -464,9 +471,18 @@ def main():
 
     # Create module files
     print_step(4, "Creating module files...")
-    for module_name in MODULE_INFO.keys():
-        if not create_module_file(module_name, parsed_data):
-            return 1
+    for module_name in _WRITERS:
+        print_success(f"  Creating {module_name}.py...")
+
+    # Each module writes its own file, so the writes can run side by side
+    with ThreadPoolExecutor(max_workers=min(MAX_WRITE_WORKERS, len(_WRITERS))) as executor:
+        results = list(executor.map(
+            lambda writer: writer(parsed_data),
+            _WRITERS.values(),
+        ))
+
+    if not all(results):
+        return 1
 
     # Create __init__.py
     print_step(5, "Creating __init__.py...")
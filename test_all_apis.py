@@ -7,23 +7,66 @@ Usage:
     python test_all_apis.py
 
 Requirements:
-    pip install requests colorama
+    pip install requests
+    pip install colorama  (Windows only)
 """
 
 import requests
 import json
+import sys
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from colorama import init, Fore, Back, Style
-
-# Initialize colorama
-init(autoreset=True)
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
+
+# Terminal colors. Only Windows consoles need colorama to translate ANSI
+# escapes; elsewhere the codes are written as-is, and left out entirely when
+# stdout is not a terminal, matching what colorama did with piped output.
+if sys.platform == 'win32':
+    from colorama import init, Fore, Style
+
+    # Initialize colorama
+    init()
+else:
+    def _sgr(code):
+        return f"\x1b[{code}m" if sys.stdout.isatty() else ""
+
+    class Fore:
+        RED = _sgr(31)
+        GREEN = _sgr(32)
+        YELLOW = _sgr(33)
+        BLUE = _sgr(34)
+        CYAN = _sgr(36)
+        WHITE = _sgr(37)
+
+    class Style:
+        BRIGHT = _sgr(1)
+        RESET_ALL = _sgr(0)
 
 # Configuration
 BASE_URL = "http://localhost:8000"
 API_VERSION = "v1"
 API_BASE = f"{BASE_URL}/api/{API_VERSION}"
 
+# One pooled session for the whole run so calls reuse keep-alive connections.
+# Cookies are not stored: every request stays as stateless as a bare
+# requests.get(), so a session cookie can't mask the 401 checks.
+_SESSION = requests.Session()
+_SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+for _prefix in ("http://", "https://"):
+    _SESSION.mount(_prefix, HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# HTTP verb -> bound session method, used by make_request()
+_VERBS = {
+    "GET": _SESSION.get,
+    "POST": _SESSION.post,
+    "PUT": _SESSION.put,
+    "PATCH": _SESSION.patch,
+    "DELETE": _SESSION.delete,
+}
+
 # Test data
 TEST_USER = {
     "phone": "+919876543210",
@@ -49,62 +92,143 @@ invitation_slug = None
 order_id = None
 
 
+def _build_header_variants(token):
+    """Precompute request headers keyed by (send_auth, json_body)."""
+    variants = {}
+    for send_auth in (False, True):
+        for json_body in (False, True):
+            headers = {}
+            if send_auth and token:
+                headers["Authorization"] = f"Bearer {token}"
+            if json_body:
+                headers["Content-Type"] = "application/json"
+            variants[(send_auth, json_body)] = headers
+    return variants
+
+
+# Shared, read-only header dicts; rebuilt only when the token rotates
+_HEADER_VARIANTS = _build_header_variants(None)
+
+
+def set_auth_token(token):
+    """Store a new access token and rebuild the header variants."""
+    global auth_token, _HEADER_VARIANTS
+    auth_token = token
+    _HEADER_VARIANTS = _build_header_variants(token)
+
+
+class _CapturingStdout:
+    """
+    stdout stand-in that diverts writes from worker threads into per-suite
+    buffers, so concurrently run suites can be printed back in order.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self, chunks):
+        """Send this thread's writes to ``chunks``; None restores the stream."""
+        self._local.chunks = chunks
+
+    def write(self, text):
+        chunks = getattr(self._local, "chunks", None)
+        if chunks is None:
+            return self._stream.write(text)
+        chunks.append(text)
+        return len(text)
+
+    def flush(self):
+        self._stream.flush()
+
+
 def print_header(title):
     """Print formatted section header."""
     print(f"\n{'=' * 80}")
-    print(f"{Fore.CYAN}{Style.BRIGHT}{title.center(80)}")
+    print(f"{Fore.CYAN}{Style.BRIGHT}{title.center(80)}{Style.RESET_ALL}")
     print(f"{'=' * 80}\n")
 
 
+# Colored result markers, built once instead of on every print_test call
+_STATUS_PREFIX = {
+    "PASS": f"{Fore.GREEN}✓ ",
+    "FAIL": f"{Fore.RED}✗ ",
+    "SKIP": f"{Fore.YELLOW}⊘ ",
+    "INFO": f"{Fore.BLUE}ℹ ",
+}
+_DETAILS_PREFIX = f"  {Fore.WHITE}"
+
+
 def print_test(name, status, details=""):
     """Print test result."""
-    if status == "PASS":
-        print(f"{Fore.GREEN}✓ {name}")
-    elif status == "FAIL":
-        print(f"{Fore.RED}✗ {name}")
-    elif status == "SKIP":
-        print(f"{Fore.YELLOW}⊘ {name}")
-    elif status == "INFO":
-        print(f"{Fore.BLUE}ℹ {name}")
+    prefix = _STATUS_PREFIX.get(status)
+    if prefix:
+        print(prefix + name + Style.RESET_ALL)
 
     if details:
-        print(f"  {Fore.WHITE}{details}")
+        print(f"{_DETAILS_PREFIX}{details}{Style.RESET_ALL}")
 
 
-def make_request(method, endpoint, data=None, auth=False, files=None, params=None):
-    """Make HTTP request and return response."""
+# Set on Ctrl-C so suite worker threads stop at their next request
+_STOP_REQUESTS = threading.Event()
+
+
+class _RunInterrupted(Exception):
+    """Raised in suite worker threads once the run has been interrupted."""
+
+
+def _send(method, endpoint, data=None, auth=False, files=None, params=None):
+    """Send an HTTP request; transport errors propagate to the caller."""
+    if _STOP_REQUESTS.is_set():
+        raise _RunInterrupted(endpoint)
+
     url = f"{API_BASE}{endpoint}"
-    headers = {}
+    headers = _HEADER_VARIANTS[(bool(auth), bool(data) and not files)]
+
+    send = _VERBS.get(method)
+    if send is None:
+        return None
 
-    if auth and auth_token:
-        headers["Authorization"] = f"Bearer {auth_token}"
+    kwargs = {"headers": headers, "timeout": 10}
+    if method == "GET":
+        kwargs["params"] = params
+    elif files:
+        kwargs["data"] = data
+        kwargs["files"] = files
+    elif method != "DELETE":
+        kwargs["json"] = data
 
-    if data and not files:
-        headers["Content-Type"] = "application/json"
+    return send(url, **kwargs)
 
-    try:
-        if method == "GET":
-            response = requests.get(url, headers=headers, params=params, timeout=10)
-        elif method == "POST":
-            if files:
-                response = requests.post(url, headers=headers, data=data, files=files, timeout=10)
-            else:
-                response = requests.post(url, headers=headers, json=data, timeout=10)
-        elif method == "PUT":
-            response = requests.put(url, headers=headers, json=data, timeout=10)
-        elif method == "PATCH":
-            response = requests.patch(url, headers=headers, json=data, timeout=10)
-        elif method == "DELETE":
-            response = requests.delete(url, headers=headers, timeout=10)
-        else:
-            return None
 
-        return response
+def make_request(method, endpoint, data=None, auth=False, files=None, params=None):
+    """Make HTTP request and return response."""
+    try:
+        return _send(method, endpoint, data, auth, files, params)
     except requests.exceptions.RequestException as e:
         print_test(f"Request failed: {endpoint}", "FAIL", str(e))
         return None
 
 
+def fetch_all(*calls):
+    """
+    Send independent requests concurrently and yield responses in call order.
+
+    Each call is a tuple of make_request arguments. Failures are reported
+    as each response is consumed, so the output reads the same as issuing
+    the calls one at a time.
+    """
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(_send, *call) for call in calls]
+
+    for call, future in zip(calls, futures):
+        try:
+            yield future.result()
+        except requests.exceptions.RequestException as e:
+            print_test(f"Request failed: {call[1]}", "FAIL", str(e))
+            yield None
+
+
 def test_api_root():
     """Test API root endpoint."""
     print_header("1. API ROOT")
@@ -114,7 +238,7 @@ def test_api_root():
         data = response.json()
         print_test("API Root accessible", "PASS", f"Status: {data.get('status')}")
         print_test("Version", "INFO", data.get('version'))
-        print(f"\n{Fore.CYAN}Available Endpoints:")
+        print(f"\n{Fore.CYAN}Available Endpoints:{Style.RESET_ALL}")
         for key, value in data.get('endpoints', {}).items():
             print(f"  - {key}: {value}")
     else:
@@ -123,7 +247,7 @@ def test_api_root():
 
 def test_authentication():
     """Test authentication endpoints."""
-    global auth_token, refresh_token, user_id
+    global refresh_token, user_id
 
     print_header("2. AUTHENTICATION")
 
@@ -132,7 +256,7 @@ def test_authentication():
     if response and response.status_code in [200, 201]:
         data = response.json()
         print_test("User registration", "PASS", f"User created: {data.get('user', {}).get('username')}")
-        auth_token = data.get('access')
+        set_auth_token(data.get('access'))
         refresh_token = data.get('refresh')
         user_id = data.get('user', {}).get('id')
     elif response and response.status_code == 400:
@@ -144,7 +268,7 @@ def test_authentication():
         })
         if response and response.status_code == 200:
             data = response.json()
-            auth_token = data.get('access')
+            set_auth_token(data.get('access'))
             refresh_token = data.get('refresh')
             user_id = data.get('user', {}).get('id')
             print_test("User login (fallback)", "PASS")
@@ -159,7 +283,7 @@ def test_authentication():
     if response and response.status_code == 200:
         data = response.json()
         print_test("User login", "PASS", f"Token received: {data.get('access')[:20]}...")
-        auth_token = data.get('access')
+        set_auth_token(data.get('access'))
         refresh_token = data.get('refresh')
     else:
         print_test("User login", "FAIL", response.text if response else "No response")
@@ -170,7 +294,7 @@ def test_authentication():
         if response and response.status_code == 200:
             data = response.json()
             print_test("Token refresh", "PASS")
-            auth_token = data.get('access')
+            set_auth_token(data.get('access'))
         else:
             print_test("Token refresh", "FAIL", response.text if response else "No response")
 
@@ -192,7 +316,7 @@ def test_authentication():
             "password": TEST_USER["password"]
         })
         if response and response.status_code == 200:
-            auth_token = response.json().get('access')
+            set_auth_token(response.json().get('access'))
     else:
         print_test("User logout", "FAIL", response.text if response else "No response")
 
@@ -201,8 +325,17 @@ def test_plans():
     """Test plans endpoints."""
     print_header("3. PLANS & TEMPLATES")
 
+    # The reads below are independent, so they are sent together
+    responses = fetch_all(
+        ("GET", "/plans/"),
+        ("GET", "/plans/FREE/"),
+        ("GET", "/plans/categories/list"),
+        ("GET", "/plans/templates/all"),
+        ("GET", "/plans/templates/featured"),
+    )
+
     # Test plan list
-    response = make_request("GET", "/plans/")
+    response = next(responses)
     if response and response.status_code == 200:
         data = response.json()
         plans_count = len(data)
@@ -213,7 +346,7 @@ def test_plans():
         print_test("Plan list", "FAIL", response.text if response else "No response")
 
     # Test plan detail
-    response = make_request("GET", "/plans/FREE/")
+    response = next(responses)
     if response and response.status_code == 200:
         data = response.json()
         print_test("Plan detail (FREE)", "PASS", f"Price: {data.get('price')}")
@@ -221,7 +354,7 @@ def test_plans():
         print_test("Plan detail (FREE)", "FAIL", response.text if response else "No response")
 
     # Test categories
-    response = make_request("GET", "/plans/categories/list")
+    response = next(responses)
     if response and response.status_code == 200:
         data = response.json()
         print_test("Category list", "PASS", f"Found {len(data)} categories")
@@ -229,7 +362,7 @@ def test_plans():
         print_test("Category list", "FAIL", response.text if response else "No response")
 
     # Test templates
-    response = make_request("GET", "/plans/templates/all")
+    response = next(responses)
     if response and response.status_code == 200:
         data = response.json()
         print_test("Template list", "PASS", f"Found {len(data)} templates")
@@ -237,7 +370,7 @@ def test_plans():
         print_test("Template list", "FAIL", response.text if response else "No response")
 
     # Test featured templates
-    response = make_request("GET", "/plans/templates/featured")
+    response = next(responses)
     if response and response.status_code == 200:
         data = response.json()
         print_test("Featured templates", "PASS", f"Found {len(data)} featured")
@@ -377,7 +510,7 @@ def test_public_endpoints():
         return
 
     # Test public invitation view
-    response = requests.get(f"{BASE_URL}/api/invite/{invitation_slug}/", timeout=10)
+    response = _SESSION.get(f"{BASE_URL}/api/invite/{invitation_slug}/", timeout=10)
     if response and response.status_code == 200:
         data = response.json()
         print_test("Public invitation view", "PASS", f"Title: {data.get('title')}")
@@ -385,7 +518,7 @@ def test_public_endpoints():
         print_test("Public invitation view", "FAIL", response.text if response else "No response")
 
     # Test guest registration
-    response = requests.post(
+    response = _SESSION.post(
         f"{BASE_URL}/api/invite/{invitation_slug}/register/",
         json={
             "name": "Guest User",
@@ -423,37 +556,108 @@ def test_error_handling():
     """Test error handling."""
     print_header("8. ERROR HANDLING")
 
+    responses = fetch_all(
+        ("GET", "/nonexistent/"),
+        ("GET", "/auth/profile/", None, False),
+        ("POST", "/auth/login/", {"invalid": "data"}),
+    )
+
     # Test 404
-    response = make_request("GET", "/nonexistent/")
+    response = next(responses)
     if response and response.status_code == 404:
         print_test("404 Not Found", "PASS")
     else:
         print_test("404 Not Found", "FAIL")
 
     # Test unauthorized access
-    response = make_request("GET", "/auth/profile/", auth=False)
+    response = next(responses)
     if response and response.status_code == 401:
         print_test("401 Unauthorized", "PASS")
     else:
         print_test("401 Unauthorized", "FAIL")
 
     # Test invalid data
-    response = make_request("POST", "/auth/login/", {"invalid": "data"})
+    response = next(responses)
     if response and response.status_code in [400, 401]:
         print_test("400 Bad Request", "PASS")
     else:
         print_test("400 Bad Request", "FAIL")
 
 
+# After authentication the suites below only read the shared token, so the
+# groups can run side by side. test_public_endpoints needs the slug created
+# by test_invitations, so those two share a group and run in sequence.
+CONCURRENT_SUITE_GROUPS = (
+    (test_plans,),
+    (test_invitations, test_public_endpoints),
+    (test_ai_features,),
+    (test_admin_dashboard,),
+    (test_error_handling,),
+)
+
+# Order in which the captured suite output is printed
+SUITE_REPORT_ORDER = (
+    test_plans,
+    test_invitations,
+    test_ai_features,
+    test_public_endpoints,
+    test_admin_dashboard,
+    test_error_handling,
+)
+
+
+def _replay_captured(stream, captured):
+    """Write the output captured so far for each suite, in report order."""
+    for suite in SUITE_REPORT_ORDER:
+        stream.write(''.join(captured.get(suite, ())))
+
+
+def run_concurrent_suites():
+    """Run the post-authentication suites concurrently, printing output in order."""
+    real_stdout = sys.stdout
+    sys.stdout = capturing = _CapturingStdout(real_stdout)
+    captured = {}
+
+    def run_group(group):
+        for suite in group:
+            captured[suite] = chunks = []
+            capturing.capture(chunks)
+            try:
+                suite()
+            finally:
+                capturing.capture(None)
+
+    executor = ThreadPoolExecutor(max_workers=4)
+    futures = [executor.submit(run_group, group) for group in CONCURRENT_SUITE_GROUPS]
+    try:
+        executor.shutdown(wait=True)
+    except KeyboardInterrupt:
+        # Drop suites that have not started and make running ones stop at
+        # their next request; a request already in flight still runs to its
+        # timeout. sys.stdout stays the capturing proxy, so whatever those
+        # workers print while unwinding is kept out of the summary.
+        _STOP_REQUESTS.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        _replay_captured(real_stdout, captured)
+        raise
+
+    sys.stdout = real_stdout
+    _replay_captured(real_stdout, captured)
+
+    # Surface the first failure only after every suite's output is shown
+    for future in futures:
+        future.result()
+
+
 def generate_report():
     """Generate test summary report."""
     print_header("TEST SUMMARY")
 
-    print(f"{Fore.CYAN}Test completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"{Fore.CYAN}Base URL: {BASE_URL}")
-    print(f"{Fore.CYAN}API Version: {API_VERSION}")
+    print(f"{Fore.CYAN}Test completed at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}Base URL: {BASE_URL}{Style.RESET_ALL}")
+    print(f"{Fore.CYAN}API Version: {API_VERSION}{Style.RESET_ALL}")
 
-    print(f"\n{Fore.YELLOW}Note: Some tests may be skipped if:")
+    print(f"\n{Fore.YELLOW}Note: Some tests may be skipped if:{Style.RESET_ALL}")
     print(f"  - Server is not running")
     print(f"  - Database is not initialized")
     print(f"  - Admin permissions are required")
@@ -462,26 +666,21 @@ def generate_report():
 
 def main():
     """Main test runner."""
-    print(f"\n{Fore.GREEN}{Style.BRIGHT}{'*' * 80}")
-    print(f"{Fore.GREEN}{Style.BRIGHT}Wedding Invitations Platform - API Test Suite".center(80))
-    print(f"{Fore.GREEN}{Style.BRIGHT}{'*' * 80}")
+    print(f"\n{Fore.GREEN}{Style.BRIGHT}{'*' * 80}{Style.RESET_ALL}")
+    print(f"{Fore.GREEN}{Style.BRIGHT}Wedding Invitations Platform - API Test Suite".center(80) + Style.RESET_ALL)
+    print(f"{Fore.GREEN}{Style.BRIGHT}{'*' * 80}{Style.RESET_ALL}")
 
     try:
         test_api_root()
         test_authentication()
-        test_plans()
-        test_invitations()
-        test_ai_features()
-        test_public_endpoints()
-        test_admin_dashboard()
-        test_error_handling()
+        run_concurrent_suites()
     except KeyboardInterrupt:
-        print(f"\n\n{Fore.YELLOW}Test interrupted by user")
+        print(f"\n\n{Fore.YELLOW}Test interrupted by user{Style.RESET_ALL}")
     except Exception as e:
-        print(f"\n\n{Fore.RED}Test failed with error: {str(e)}")
+        print(f"\n\n{Fore.RED}Test failed with error: {str(e)}{Style.RESET_ALL}")
     finally:
         generate_report()
-        print(f"\n{Fore.GREEN}{'*' * 80}\n")
+        print(f"\n{Fore.GREEN}{'*' * 80}{Style.RESET_ALL}\n")
 
 
 if __name__ == "__main__":
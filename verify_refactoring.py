@@ -17,8 +17,10 @@ Checks:
 
 import os
 import sys
-import subprocess
+import importlib
 from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 
 # =============================================================================
@@ -29,6 +31,9 @@ PROJECT_ROOT = Path(__file__).parent
 AI_APP_PATH = PROJECT_ROOT / "apps/backend/src/apps/ai"
 VIEWS_DIR = AI_APP_PATH / "views"
 
+# Generous average line length used to bound reads in check_file_sizes()
+SIZE_CHECK_BYTES_PER_LINE = 200
+
 
 # Expected structure
 EXPECTED_MODULES = {
@@ -60,6 +65,15 @@ EXPECTED_MODULES = {
     },
 }
 
+# Expected exports are read-only; keep them in declared order for the report
+for _config in EXPECTED_MODULES.values():
+    _config['exports'] = tuple(_config['exports'])
+del _config
+
+# Per-module lookups derived once from EXPECTED_MODULES
+_MODULE_PATHS = {name: VIEWS_DIR / name for name in EXPECTED_MODULES}
+_DOTTED = {name: f"apps.backend.src.apps.ai.views.{name[:-3]}" for name in EXPECTED_MODULES}
+
 
 # =============================================================================
 # Utility Functions
@@ -71,160 +85,331 @@ def print_header(text):
     print(f"{'='*70}\n")
 
 
-def print_check(text):
-    print(f"[CHECK] {text}")
+class Reporter:
+    """
+    Collects one check's output and writes it with a single writelines().
+
+    Every check gets its own Reporter, so checks can run concurrently and
+    still be printed in a fixed order.
+    """
+
+    def __init__(self):
+        self.buf = []
+
+    def check(self, text):
+        self.buf.append(f"[CHECK] {text}\n")
+
+    def success(self, text):
+        self.buf.append(f"  ✓ {text}\n")
+
+    def error(self, text):
+        self.buf.append(f"  ✗ {text}\n")
+
+    def warning(self, text):
+        self.buf.append(f"  ⚠  {text}\n")
+
+    def emit(self, prefix, blob):
+        """Add a possibly large blob after a prefix without building a joined copy."""
+        self.buf.extend((prefix, blob, "\n"))
+
+    def flush(self):
+        sys.stdout.writelines(self.buf)
+        self.buf.clear()
 
 
-def print_success(text):
-    print(f"  ✓ {text}")
+# Stat results by path; None records a path that does not exist
+_STAT_CACHE = {}
 
 
-def print_error(text):
-    print(f"  ✗ {text}")
+def cached_stat(path):
+    """
+    Stat a path once per run.
+
+    Returns:
+        os.stat_result, or None if the path does not exist
+    """
+    try:
+        return _STAT_CACHE[path]
+    except KeyError:
+        pass
+
+    try:
+        result = path.stat()
+    except (FileNotFoundError, NotADirectoryError):
+        result = None
+
+    _STAT_CACHE[path] = result
+    return result
+
+
+@lru_cache(maxsize=None)
+def scan_views_dir():
+    """
+    List views/ once for every check that needs to know which files exist.
+
+    Returns:
+        dict mapping file name to os.DirEntry, or None if views/ is missing
+    """
+    try:
+        with os.scandir(VIEWS_DIR) as entries:
+            return {entry.name: entry for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
 
+# O_BINARY keeps the Windows CRT from translating CRLF or stopping at 0x1A
+_RO_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0) | getattr(os, 'O_CLOEXEC', 0)
+_NOATIME = getattr(os, 'O_NOATIME', 0)
 
-def print_warning(text):
-    print(f"  ⚠  {text}")
+
+def _open_ro(path):
+    """
+    Open a file for binary reading without updating its access time.
+
+    O_NOATIME is Linux-only and refused for files we do not own; the file
+    is then opened normally.
+    """
+    try:
+        fd = os.open(path, _RO_FLAGS | _NOATIME)
+    except PermissionError:
+        if not _NOATIME:
+            raise
+        fd = os.open(path, _RO_FLAGS)
+    return os.fdopen(fd, 'rb', buffering=1 << 16)
+
+
+# Complete module contents by file name, shared by the size and syntax checks
+_SOURCE_CACHE = {}
+
+
+def read_module_head(module_name, limit):
+    """
+    Read at most ``limit`` bytes of a views/ module.
+
+    A read that reaches end of file is cached for read_module().
+
+    Returns:
+        Tuple of (data, complete); complete is False if the file may be longer
+
+    Raises:
+        OSError: if the module cannot be read
+    """
+    data = _SOURCE_CACHE.get(module_name)
+    if data is not None:
+        return data, True
+
+    with _open_ro(_MODULE_PATHS[module_name]) as f:
+        data = f.read(limit)
+
+    if len(data) < limit:
+        _SOURCE_CACHE[module_name] = data
+        return data, True
+
+    return data, False
+
+
+def read_module(module_name):
+    """
+    Read a views/ module once for both the size and the syntax checks.
+
+    Returns:
+        The file contents as bytes
+
+    Raises:
+        OSError: if the module cannot be read (not cached, so a retry re-reads)
+    """
+    data = _SOURCE_CACHE.get(module_name)
+    if data is None:
+        with _open_ro(_MODULE_PATHS[module_name]) as f:
+            data = _SOURCE_CACHE[module_name] = f.read()
+    return data
 
 
 # =============================================================================
 # Verification Functions
 # =============================================================================
 
-def check_directory_structure():
+def check_directory_structure(reporter):
     """Check that views/ directory and files exist."""
-    print_check("Verifying directory structure...")
+    reporter.check("Verifying directory structure...")
 
-    if not VIEWS_DIR.exists():
-        print_error(f"views/ directory not found: {VIEWS_DIR}")
+    present = scan_views_dir()
+    if present is None:
+        reporter.error(f"views/ directory not found: {VIEWS_DIR}")
         return False
 
-    print_success(f"views/ directory exists")
+    reporter.success(f"views/ directory exists")
 
     # Check __init__.py
-    init_file = VIEWS_DIR / "__init__.py"
-    if not init_file.exists():
-        print_error("__init__.py not found in views/")
+    if "__init__.py" not in present:
+        reporter.error("__init__.py not found in views/")
         return False
 
-    print_success("__init__.py exists")
+    reporter.success("__init__.py exists")
 
     # Check module files
     all_exist = True
-    for module_name in EXPECTED_MODULES.keys():
-        module_path = VIEWS_DIR / module_name
-        if module_path.exists():
-            print_success(f"{module_name} exists")
+    for module_name in EXPECTED_MODULES:
+        if module_name in present:
+            reporter.success(f"{module_name} exists")
         else:
-            print_error(f"{module_name} not found")
+            reporter.error(f"{module_name} not found")
             all_exist = False
 
     return all_exist
 
 
-def check_file_sizes():
+def check_file_sizes(reporter):
     """Check that module files are reasonable sizes."""
-    print_check("Verifying file sizes...")
+    reporter.check("Verifying file sizes...")
+
+    present = scan_views_dir() or {}
 
     all_ok = True
     for module_name, config in EXPECTED_MODULES.items():
-        module_path = VIEWS_DIR / module_name
-        if not module_path.exists():
+        if module_name not in present:
             continue
 
-        with open(module_path, 'r', encoding='utf-8') as f:
-            line_count = len(f.readlines())
-
         min_lines = config['min_lines']
         max_lines = config['max_lines']
 
+        # Only read enough to prove a runaway file is over the limit
+        data, complete = read_module_head(module_name, max_lines * SIZE_CHECK_BYTES_PER_LINE + 4096)
+        line_count = data.count(b'\n')
+        if not complete:
+            if line_count > max_lines:
+                reporter.warning(f"{module_name}: more than {max_lines} lines (expected <={max_lines})")
+                continue
+            data = read_module(module_name)
+            line_count = data.count(b'\n')
+
+        # A final line without a newline still counts
+        if data and not data.endswith(b'\n'):
+            line_count += 1
+
         if min_lines <= line_count <= max_lines:
-            print_success(f"{module_name}: {line_count} lines (OK)")
+            reporter.success(f"{module_name}: {line_count} lines (OK)")
         elif line_count < min_lines:
-            print_warning(f"{module_name}: {line_count} lines (expected >={min_lines})")
+            reporter.warning(f"{module_name}: {line_count} lines (expected >={min_lines})")
             all_ok = False
         else:
-            print_warning(f"{module_name}: {line_count} lines (expected <={max_lines})")
+            reporter.warning(f"{module_name}: {line_count} lines (expected <={max_lines})")
 
     return all_ok
 
 
-def check_syntax():
-    """Check for syntax errors in all modules."""
-    print_check("Checking for syntax errors...")
+def _compile_one(module_name):
+    """
+    Compile a single expected module in this interpreter.
 
-    all_ok = True
-    for module_name in EXPECTED_MODULES.keys():
-        module_path = VIEWS_DIR / module_name
+    Returns:
+        Tuple of (module_name, exception raised or None)
+    """
+    module_path = _MODULE_PATHS[module_name]
 
-        try:
-            result = subprocess.run(
-                [sys.executable, '-m', 'py_compile', str(module_path)],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-
-            if result.returncode == 0:
-                print_success(f"{module_name}: No syntax errors")
-            else:
-                print_error(f"{module_name}: Syntax error\n{result.stderr}")
-                all_ok = False
+    try:
+        # Compile the raw bytes so compile() honours any coding declaration
+        compile(read_module(module_name), str(module_path), 'exec')
+        return module_name, None
+    except (SyntaxError, ValueError, OSError) as e:
+        return module_name, e
+
+
+def check_syntax_all():
+    """
+    Compile every expected module.
+
+    compile() holds the GIL and the files are small, so this stays a plain
+    loop; a thread pool only added overhead here.
+
+    Returns:
+        dict mapping module name to the exception raised, or None if it compiled
+    """
+    return dict(map(_compile_one, EXPECTED_MODULES))
 
-        except subprocess.TimeoutExpired:
-            print_error(f"{module_name}: Compilation timeout")
+
+def check_syntax(reporter, imports_passed=False):
+    """
+    Check for syntax errors in all modules.
+
+    Importing a module compiles all of it first, so once check_imports has
+    passed there is nothing left to find; the per-file compile only runs to
+    pinpoint syntax errors after an import failure.
+
+    Args:
+        reporter: Reporter collecting this check's output
+        imports_passed: Result of check_imports, if it has already run
+    """
+    reporter.check("Checking for syntax errors...")
+
+    if imports_passed:
+        reporter.success("All modules compiled during the import check")
+        return True
+
+    all_ok = True
+    for module_name, error in check_syntax_all().items():
+        if error is None:
+            reporter.success(f"{module_name}: No syntax errors")
+        elif isinstance(error, (SyntaxError, ValueError)):
+            reporter.error(f"{module_name}: Syntax error")
+            reporter.emit("", str(error))
             all_ok = False
-        except Exception as e:
-            print_error(f"{module_name}: {e}")
+        else:
+            reporter.error(f"{module_name}: {error}")
             all_ok = False
 
     return all_ok
 
 
-def check_imports():
+def check_imports(reporter):
     """Check that all classes can be imported."""
-    print_check("Verifying imports...")
-
-    # Add project root to Python path
-    sys.path.insert(0, str(PROJECT_ROOT))
+    reporter.check("Verifying imports...")
 
     all_ok = True
     for module_name, config in EXPECTED_MODULES.items():
-        module_path = f"apps.backend.src.apps.ai.views.{module_name.replace('.py', '')}"
+        # Import each module once, then look its exports up on it
+        try:
+            module = importlib.import_module(_DOTTED[module_name])
+        except ImportError as e:
+            reporter.error(f"Import failed: {module_name}")
+            reporter.emit("    Error: ", str(e))
+            all_ok = False
+            continue
+        except Exception as e:
+            reporter.error(f"Unexpected error importing {module_name}: {e}")
+            all_ok = False
+            continue
 
         for export_name in config['exports']:
-            try:
-                # Dynamic import
-                parts = module_path.split('.')
-                module = __import__(module_path, fromlist=[export_name])
-                obj = getattr(module, export_name)
-
-                print_success(f"Import successful: {export_name} from {module_name}")
-
-            except ImportError as e:
-                print_error(f"Import failed: {export_name} from {module_name}")
-                print(f"    Error: {e}")
-                all_ok = False
-            except AttributeError as e:
-                print_error(f"Class not found: {export_name} in {module_name}")
-                all_ok = False
-            except Exception as e:
-                print_error(f"Unexpected error importing {export_name}: {e}")
+            if hasattr(module, export_name):
+                reporter.success(f"Import successful: {export_name} from {module_name}")
+            else:
+                reporter.error(f"Class not found: {export_name} in {module_name}")
                 all_ok = False
 
     return all_ok
 
 
-def check_django():
-    """Run Django system checks."""
-    print_check("Running Django checks...")
+def check_django(reporter):
+    """
+    Run Django system checks.
+
+    The checks run in a `manage.py check` child interpreter. They cannot run
+    in-process: this script's directory, the repository root, is on sys.path,
+    so its apps/ directory shadows the backend's apps package that
+    INSTALLED_APPS refers to, and check_imports relies on that root package.
+    """
+    reporter.check("Running Django checks...")
 
     manage_py = PROJECT_ROOT / "apps/backend/src/manage.py"
 
-    if not manage_py.exists():
-        print_warning("manage.py not found, skipping Django checks")
+    if cached_stat(manage_py) is None:
+        reporter.warning("manage.py not found, skipping Django checks")
         return True
 
+    # Only needed for this check, so not imported at startup
+    import subprocess
+
     try:
         result = subprocess.run(
             [sys.executable, str(manage_py), 'check'],
@@ -235,34 +420,35 @@ def check_django():
         )
 
         if result.returncode == 0:
-            print_success("Django checks passed")
-            print(f"    {result.stdout.strip()}")
+            reporter.success("Django checks passed")
+            reporter.emit("    ", result.stdout.strip())
             return True
         else:
-            print_error("Django checks failed")
-            print(f"    {result.stderr}")
+            reporter.error("Django checks failed")
+            reporter.emit("    ", result.stderr)
             return False
 
     except subprocess.TimeoutExpired:
-        print_warning("Django check timeout (30s)")
+        reporter.warning("Django check timeout (30s)")
         return False
     except Exception as e:
-        print_error(f"Failed to run Django checks: {e}")
+        reporter.error(f"Failed to run Django checks: {e}")
         return False
 
 
-def check_backup_exists():
+def check_backup_exists(reporter):
     """Check that backup file exists."""
-    print_check("Verifying backup...")
+    reporter.check("Verifying backup...")
 
     backup_file = AI_APP_PATH / "views_backup.py"
 
-    if backup_file.exists():
-        size = backup_file.stat().st_size
-        print_success(f"Backup exists: views_backup.py ({size:,} bytes)")
+    backup_stat = cached_stat(backup_file)
+    if backup_stat is not None:
+        size = backup_stat.st_size
+        reporter.success(f"Backup exists: views_backup.py ({size:,} bytes)")
         return True
     else:
-        print_warning("Backup not found: views_backup.py")
+        reporter.warning("Backup not found: views_backup.py")
         return False
 
 
@@ -310,6 +496,24 @@ def generate_report(results):
 # Main Execution
 # =============================================================================
 
+def run_checks(checks, reporters):
+    """
+    Run independent checks side by side.
+
+    Output is only collected; the caller flushes the reporters in order.
+
+    Args:
+        checks: dict mapping report name to check function
+        reporters: dict mapping report name to the Reporter for that check
+
+    Returns:
+        dict mapping report name to the check's finished Future
+    """
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = {name: executor.submit(check, reporters[name]) for name, check in checks.items()}
+    return futures
+
+
 def main():
     """Run all verification checks."""
     print_header("Refactoring Verification Script")
@@ -317,15 +521,38 @@ def main():
     print(f"Target: {VIEWS_DIR}")
     print(f"Python: {sys.version}")
 
-    results = {}
+    # Make the apps.* package importable for check_imports()
+    sys.path.insert(0, str(PROJECT_ROOT))
 
-    # Run all checks
-    results['Directory Structure'] = check_directory_structure()
-    results['File Sizes'] = check_file_sizes()
-    results['Syntax Errors'] = check_syntax()
-    results['Imports'] = check_imports()
-    results['Django Checks'] = check_django()
-    results['Backup Exists'] = check_backup_exists()
+    # One reporter per check, in report order
+    reporters = {
+        name: Reporter()
+        for name in ('Directory Structure', 'File Sizes', 'Syntax Errors',
+                     'Imports', 'Django Checks', 'Backup Exists')
+    }
+
+    # Run the independent checks concurrently
+    futures = run_checks({
+        'Directory Structure': check_directory_structure,
+        'File Sizes': check_file_sizes,
+        'Imports': check_imports,
+        'Django Checks': check_django,
+        'Backup Exists': check_backup_exists,
+    }, reporters)
+
+    # The syntax check needs the import result, so it runs once those finish
+    imports = futures['Imports']
+    imports_passed = imports.exception() is None and imports.result()
+    syntax_ok = check_syntax(reporters['Syntax Errors'], imports_passed=imports_passed)
+
+    for reporter in reporters.values():
+        reporter.flush()
+
+    # Surface the first failure only after every check's output is shown
+    results = {
+        name: syntax_ok if name == 'Syntax Errors' else futures[name].result()
+        for name in reporters
+    }
 
     # Generate report
     exit_code = generate_report(results)